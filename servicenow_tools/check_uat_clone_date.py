@@ -8,7 +8,13 @@ import logging
 from datetime import UTC, datetime
 from typing import Optional
 
-from servicenow_tools.servicenow_api import ServiceNowClient, ServiceNowError
+from servicenow_tools.servicenow_api import (
+    ServiceNowClient,
+    ServiceNowCredentials,
+    ServiceNowError,
+    get_client,
+    get_registry,
+)
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_STALE_DAYS = 30
@@ -124,8 +130,8 @@ def main() -> None:
     args = parse_args()
     configure_logging(args.verbose)
 
-    client = ServiceNowClient.from_environment(args.source_environment)
-    target_name = ServiceNowClient.from_environment(args.target_environment).credentials.instance_name
+    client = get_client(args.source_environment)
+    target_name = ServiceNowCredentials.from_environment(args.target_environment).instance_name
 
     status = evaluate_clone_status(
         client,
@@ -133,6 +139,7 @@ def main() -> None:
         stale_after_days=args.stale_after_days,
     )
     print(json.dumps(status, indent=2))
+    get_registry().log_stats()
 
 
 if __name__ == "__main__":
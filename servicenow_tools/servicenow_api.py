@@ -4,12 +4,21 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
-from typing import Any, Iterable, Mapping, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional, Protocol
 from urllib.parse import urlparse
 
 import requests
-from requests import Response, Session
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:  # Optional HTTP/2 transport
+    import httpx
+except ImportError:
+    httpx = None
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,6 +27,36 @@ class ServiceNowError(RuntimeError):
     """Raised when the ServiceNow API returns a failure."""
 
 
+class TransportResponse(Protocol):
+    """Response surface shared by ``requests.Response`` and ``httpx.Response``."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def text(self) -> str: ...
+
+    def json(self) -> Any: ...
+
+
+class TransportSession(Protocol):
+    """Session surface ServiceNowClient relies on (``requests.Session`` or the HTTP/2 transport)."""
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        auth: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Optional[Mapping[str, Any]] = None,
+        timeout: Any = None,
+        verify: Any = None,
+    ) -> TransportResponse: ...
+
+    def close(self) -> None: ...
+
+
 @dataclass(slots=True)
 class ServiceNowCredentials:
     """Container for ServiceNow connection settings."""
@@ -27,6 +66,9 @@ class ServiceNowCredentials:
     password: str
     verify_ssl: bool = True
     timeout: int = 30
+    pool_size: int = 10
+    idle_timeout: float = 60.0
+    http2: bool = False
 
     @property
     def instance_name(self) -> str:
@@ -34,20 +76,9 @@ class ServiceNowCredentials:
         host = parsed.hostname or self.url
         return host.split(".")[0]
 
-
-class ServiceNowClient:
-    """Minimal REST client for ServiceNow table endpoints."""
-
-    def __init__(self, credentials: ServiceNowCredentials, session: Optional[Session] = None) -> None:
-        self.credentials = credentials
-        self.session = session or requests.Session()
-
-    # ------------------------------------------------------------------ #
-    # Helper constructors
-    # ------------------------------------------------------------------ #
     @classmethod
-    def from_environment(cls, environment: str) -> "ServiceNowClient":
-        """Instantiate a client using SERVICENOW_<ENV>_* environment variables."""
+    def from_environment(cls, environment: str) -> "ServiceNowCredentials":
+        """Load settings from SERVICENOW_<ENV>_* environment variables."""
         env = environment.upper()
         prefixes = [
             f"{env}_SERVICENOW",
@@ -73,14 +104,270 @@ class ServiceNowClient:
 
         verify_ssl = (_lookup("VERIFY_SSL") or "true").lower() != "false"
         timeout = int(_lookup("TIMEOUT") or "30")
-        creds = ServiceNowCredentials(
+        pool_size = int(_lookup("POOL_SIZE") or _lookup("MAX_WORKERS") or "10")
+        idle_timeout = float(_lookup("IDLE_TIMEOUT") or "60")
+        http2 = (_lookup("HTTP2") or "false").lower() == "true"
+        return cls(
             url=url.rstrip("/"),
             username=username,
             password=password,
             verify_ssl=verify_ssl,
             timeout=timeout,
+            pool_size=max(pool_size, 1),
+            idle_timeout=idle_timeout,
+            http2=http2,
         )
-        return cls(creds)
+
+
+@dataclass(slots=True)
+class ConnectionPoolStats:
+    """Thread-safe counters describing how well pooled connections are reused.
+
+    ``tracks_pool_waits`` is False for transports that cannot observe pool
+    checkouts (the httpx HTTP/2 path), in which case wait fields are omitted.
+    """
+
+    tracks_pool_waits: bool = True
+    requests: int = 0
+    new_connections: int = 0
+    checkouts: int = 0
+    pool_waits: int = 0
+    pool_wait_seconds: float = 0.0
+    max_pool_wait_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def record_checkout(self, seconds: float, *, waited: bool) -> None:
+        """Record a pool checkout; only checkouts that found the pool exhausted count as waits."""
+        with self._lock:
+            self.checkouts += 1
+            if waited:
+                self.pool_waits += 1
+                self.pool_wait_seconds += seconds
+                self.max_pool_wait_seconds = max(self.max_pool_wait_seconds, seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a point-in-time summary including reuse ratio and pool wait times."""
+        with self._lock:
+            reused = max(self.requests - self.new_connections, 0)
+            summary: dict[str, Any] = {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reuse_ratio": reused / self.requests if self.requests else 0.0,
+            }
+            if not self.tracks_pool_waits:
+                return summary
+            summary.update({
+                "checkouts": self.checkouts,
+                "pool_waits": self.pool_waits,
+                "pool_wait_seconds": self.pool_wait_seconds,
+                "avg_pool_wait_ms": (
+                    self.pool_wait_seconds / self.pool_waits * 1000 if self.pool_waits else 0.0
+                ),
+                "max_pool_wait_ms": self.max_pool_wait_seconds * 1000,
+            })
+            return summary
+
+
+def _instrumented_pool_class(
+    base: type[HTTPConnectionPool],
+    stats: ConnectionPoolStats,
+    pool_timeout: Optional[float],
+) -> type:
+    """Subclass a urllib3 pool so connection checkouts and handshakes are counted.
+
+    Handshakes are counted in ``connect()`` rather than ``_new_conn()`` because
+    urllib3 reuses the connection object when a dropped keep-alive socket is
+    reopened, and that reconnect still pays a full TCP/TLS handshake.
+
+    requests never passes ``pool_timeout`` to ``urlopen``, so ``pool_timeout`` is
+    applied here as the default checkout timeout. A leaked connection then raises
+    ``EmptyPoolError`` instead of blocking callers forever.
+    """
+
+    class InstrumentedConnection(base.ConnectionCls):  # type: ignore[misc, name-defined]
+        def connect(self) -> None:
+            stats.record_new_connection()
+            super().connect()
+
+    class InstrumentedPool(base):  # type: ignore[misc, valid-type]
+        ConnectionCls = InstrumentedConnection
+
+        def _get_conn(self, timeout=None):  # noqa: ANN001, ANN202 - mirrors urllib3 signature
+            # An empty queue means every connection is checked out and this caller blocks.
+            waited = self.pool is not None and self.pool.empty()
+            if timeout is None:
+                timeout = pool_timeout
+            started = time.perf_counter()
+            try:
+                return super()._get_conn(timeout=timeout)
+            finally:
+                stats.record_checkout(time.perf_counter() - started, waited=waited)
+
+    InstrumentedConnection.__name__ = f"Instrumented{base.ConnectionCls.__name__}"
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with blocking keep-alive pools, idle eviction and reuse metrics.
+
+    Each (scheme, host) pool keeps up to ``pool_size`` keep-alive connections, so
+    TLS handshakes are paid once per connection rather than once per request.
+    Callers beyond ``pool_size`` wait for a free connection instead of opening
+    throwaway ones. Pools left unused for ``idle_timeout`` seconds are dropped
+    before the next request so stale sockets are not reused. A checkout that
+    waits longer than ``pool_timeout`` seconds raises ``urllib3.exceptions.EmptyPoolError``.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        idle_timeout: float,
+        stats: Optional[ConnectionPoolStats] = None,
+        *,
+        pool_timeout: Optional[float] = None,
+    ) -> None:
+        self.stats = stats or ConnectionPoolStats()
+        self.idle_timeout = idle_timeout
+        self.pool_timeout = pool_timeout
+        self._last_used = time.monotonic()
+        self._idle_lock = threading.Lock()
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _instrumented_pool_class(HTTPConnectionPool, self.stats, self.pool_timeout),
+            "https": _instrumented_pool_class(HTTPSConnectionPool, self.stats, self.pool_timeout),
+        }
+
+    def send(self, request, **kwargs):  # noqa: ANN001, ANN201 - mirrors HTTPAdapter signature
+        self._evict_if_idle()
+        self.stats.record_request()
+        return super().send(request, **kwargs)
+
+    def _evict_if_idle(self) -> None:
+        with self._idle_lock:
+            now = time.monotonic()
+            if self.idle_timeout > 0 and now - self._last_used > self.idle_timeout:
+                LOGGER.debug("Evicting ServiceNow connections idle for %.1fs", now - self._last_used)
+                self.poolmanager.clear()
+            self._last_used = now
+
+
+class _Http2Session:
+    """Adapter exposing the subset of ``requests.Session`` used by ServiceNowClient over httpx."""
+
+    def __init__(self, credentials: ServiceNowCredentials, stats: ConnectionPoolStats) -> None:
+        self._client = httpx.Client(
+            http2=True,
+            verify=credentials.verify_ssl,
+            limits=httpx.Limits(
+                max_connections=credentials.pool_size,
+                max_keepalive_connections=credentials.pool_size,
+                keepalive_expiry=credentials.idle_timeout,
+            ),
+        )
+        # httpcore exposes no trace event for waiting on a pooled connection.
+        stats.tracks_pool_waits = False
+        self.stats = stats
+
+    def _trace(self, event_name: str, info: Mapping[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.stats.record_new_connection()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        auth: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Optional[Mapping[str, Any]] = None,
+        timeout: Any = None,
+        verify: Any = None,
+    ) -> TransportResponse:
+        # TLS verification is fixed on the httpx client; per-request ``verify`` is ignored.
+        self.stats.record_request()
+        return self._client.request(
+            method,
+            url,
+            auth=auth,
+            params=params,
+            json=json,
+            timeout=timeout,
+            extensions={"trace": self._trace},
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def build_pooled_session(
+    credentials: ServiceNowCredentials,
+    stats: Optional[ConnectionPoolStats] = None,
+) -> TransportSession:
+    """Create a keep-alive session sized for ``credentials.pool_size`` concurrent callers."""
+    stats = stats or ConnectionPoolStats()
+    if credentials.http2:
+        try:
+            if httpx is None:
+                raise ImportError("httpx is not installed")
+            # httpx raises ImportError here when the optional h2 package is missing.
+            return _Http2Session(credentials, stats)
+        except ImportError as exc:
+            LOGGER.warning(
+                "HTTP/2 requested but httpx[http2] is not available (%s); falling back to HTTP/1.1.",
+                exc,
+            )
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(
+        credentials.pool_size,
+        credentials.idle_timeout,
+        stats,
+        pool_timeout=credentials.timeout,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class ServiceNowClient:
+    """Minimal REST client for ServiceNow table endpoints."""
+
+    def __init__(self, credentials: ServiceNowCredentials, session: Optional[TransportSession] = None) -> None:
+        self.credentials = credentials
+        self.session: TransportSession = session or requests.Session()
+
+    def connection_stats(self) -> Optional[dict[str, Any]]:
+        """Return connection reuse metrics when the session is pooled, else None."""
+        stats = getattr(self.session, "stats", None)
+        if stats is None and isinstance(self.session, Session):
+            stats = getattr(self.session.get_adapter(self.credentials.url), "stats", None)
+        return stats.snapshot() if stats is not None else None
+
+    def close(self) -> None:
+        self.session.close()
+
+    # ------------------------------------------------------------------ #
+    # Helper constructors
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def from_environment(cls, environment: str) -> "ServiceNowClient":
+        """Instantiate a client using SERVICENOW_<ENV>_* environment variables.
+
+        Builds a new client on every call; use :func:`get_client` to share a
+        pooled client per environment across threads.
+        """
+        return cls(ServiceNowCredentials.from_environment(environment))
 
     # ------------------------------------------------------------------ #
     # Core REST helpers
@@ -145,7 +432,7 @@ class ServiceNowClient:
         *,
         params: Optional[Mapping[str, Any]] = None,
         json_payload: Optional[Mapping[str, Any]] = None,
-    ) -> Response:
+    ) -> TransportResponse:
         url = f"{self.credentials.url}{path}"
         LOGGER.debug("ServiceNow request %s %s", method, url)
         response = self.session.request(
@@ -166,10 +453,102 @@ class ServiceNowClient:
         return response
 
     @staticmethod
-    def _extract_result(response: Response) -> dict[str, Any]:
+    def _extract_result(response: TransportResponse) -> dict[str, Any]:
         payload = response.json()
         result = payload.get("result")
         if result is None:
             raise ServiceNowError("ServiceNow response missing 'result'")
         return result
 
+
+class ServiceNowClientRegistry:
+    """Process-wide cache of pooled clients keyed by environment.
+
+    Clients are created once per environment with a :class:`PooledHTTPAdapter`
+    (or the HTTP/2 transport) and are safe to share across a thread pool.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, ServiceNowClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, environment: str, *, pool_size: Optional[int] = None) -> ServiceNowClient:
+        """Return the shared client for ``environment``, creating it on first use.
+
+        Args:
+            environment: ServiceNow environment name (e.g. ``UAT``).
+            pool_size: Concurrency the caller intends to use; the pool is sized to
+                at least this many connections when the client is first created.
+        """
+        key = environment.upper()
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    credentials = ServiceNowCredentials.from_environment(environment)
+                    if pool_size and pool_size > credentials.pool_size:
+                        credentials.pool_size = pool_size
+                    client = ServiceNowClient(credentials, session=build_pooled_session(credentials))
+                    self._clients[key] = client
+                    LOGGER.debug(
+                        "Created pooled ServiceNow client for %s (pool_size=%d, http2=%s)",
+                        key,
+                        credentials.pool_size,
+                        credentials.http2,
+                    )
+        if pool_size and pool_size > client.credentials.pool_size:
+            LOGGER.warning(
+                "ServiceNow client for %s already pooled with %d connections; %d requested.",
+                key,
+                client.credentials.pool_size,
+                pool_size,
+            )
+        return client
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return connection reuse metrics for every registered environment."""
+        with self._lock:
+            clients = dict(self._clients)
+        return {key: client.connection_stats() or {} for key, client in clients.items()}
+
+    def log_stats(self, level: int = logging.INFO) -> None:
+        for key, snapshot in self.stats().items():
+            if "checkouts" in snapshot:
+                waits = (
+                    f"{snapshot['pool_waits']}/{snapshot['checkouts']} checkouts waited "
+                    f"(avg {snapshot['avg_pool_wait_ms']:.1f}ms, max {snapshot['max_pool_wait_ms']:.1f}ms, "
+                    f"total {snapshot['pool_wait_seconds']:.2f}s)"
+                )
+            else:
+                waits = "pool waits not measured"
+            LOGGER.log(
+                level,
+                "ServiceNow %s connections: %d requests, %d new connections, reuse ratio %.2f, %s",
+                key,
+                snapshot.get("requests", 0),
+                snapshot.get("new_connections", 0),
+                snapshot.get("reuse_ratio", 0.0),
+                waits,
+            )
+
+    def close_all(self) -> None:
+        """Close every pooled session and forget the cached clients."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+_REGISTRY = ServiceNowClientRegistry()
+
+
+def get_client(environment: str, *, pool_size: Optional[int] = None) -> ServiceNowClient:
+    """Return the process-wide pooled client for ``environment``."""
+    return _REGISTRY.get(environment, pool_size=pool_size)
+
+
+def get_registry() -> ServiceNowClientRegistry:
+    """Return the process-wide client registry."""
+    return _REGISTRY
@@ -6,11 +6,13 @@ import argparse
 import logging
 import os
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Mapping, Optional
 
 import psycopg2
 import psycopg2.extras
+from psycopg2 import sql
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +25,14 @@ COMMON_MARKER_END = "<!-- /AUTO-GENERATED:VALIDATION_COMMON_ISSUES -->"
 STANDARDS_MARKER_START = "<!-- AUTO-GENERATED:VALIDATION_STANDARD_SUGGESTIONS -->"
 STANDARDS_MARKER_END = "<!-- /AUTO-GENERATED:VALIDATION_STANDARD_SUGGESTIONS -->"
 
+# Bucket width in days and the lag (in buckets) that spans one week.
+TREND_GRANULARITIES = {
+    "day": (1, 7),
+    "week": (7, 1),
+}
+DEFAULT_TREND_WINDOWS = {"day": 7, "week": 4}
+DEFAULT_TIMESTAMP_COLUMN = "created_at"
+
 
 @dataclass(slots=True)
 class FrequentIssue:
@@ -33,6 +43,26 @@ class FrequentIssue:
     sample_details: str
 
 
+@dataclass(slots=True)
+class FailureTrend:
+    """Rolling failure rate for a check over the most recent time bucket."""
+
+    check_name: str
+    status: str
+    bucket_start: datetime
+    window_failures: int
+    window_runs: int
+    rolling_rate: float
+    previous_rate: Optional[float]
+    rate_delta: Optional[float]
+
+    def describe(self) -> str:
+        rate = f"{self.rolling_rate:.1%} of runs"
+        if self.status == "new":
+            return f"new ({rate})"
+        return f"rising {self.rate_delta * 100:+.1f} pts ({rate})"
+
+
 def configure_logging(verbosity: int) -> None:
     level = logging.WARNING
     if verbosity == 1:
@@ -42,6 +72,14 @@ def configure_logging(verbosity: int) -> None:
     logging.basicConfig(level=level, format="%(levelname)s %(name)s - %(message)s")
 
 
+def positive_int(value: str) -> int:
+    """argparse type accepting integers >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1 (got {number})")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Analyze validation history and update documentation.",
@@ -64,6 +102,35 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print suggested updates without modifying files.",
     )
+    parser.add_argument(
+        "--trend",
+        choices=sorted(TREND_GRANULARITIES),
+        default=None,
+        help="Bucket failures by day or week and flag rising or newly appearing checks.",
+    )
+    parser.add_argument(
+        "--trend-window",
+        type=positive_int,
+        default=None,
+        help="Buckets per rolling window (default: 7 for day, 4 for week).",
+    )
+    parser.add_argument(
+        "--trend-lookback-days",
+        type=positive_int,
+        default=180,
+        help="Days of history scanned for trend analysis (default: 180).",
+    )
+    parser.add_argument(
+        "--min-rate-delta",
+        type=float,
+        default=0.05,
+        help="Week-over-week increase in failure rate required to flag a check as rising.",
+    )
+    parser.add_argument(
+        "--timestamp-column",
+        default=DEFAULT_TIMESTAMP_COLUMN,
+        help=f"validation_results column used to bucket trends (default: {DEFAULT_TIMESTAMP_COLUMN}).",
+    )
     return parser.parse_args()
 
 
@@ -96,23 +163,195 @@ def fetch_common_issues(database_url: str, min_occurrences: int) -> list[Frequen
     return issues
 
 
-def build_common_issues_table(issues: Iterable[FrequentIssue]) -> str:
-    """Render a markdown table for common issues."""
-    lines = [
-        "| Check | Occurrences | Sample Details |",
-        "| --- | ---: | --- |",
+def fetch_failure_trends(
+    database_url: str,
+    *,
+    granularity: str,
+    window: int,
+    lookback_days: int,
+    min_occurrences: int,
+    min_rate_delta: float,
+    timestamp_column: str = DEFAULT_TIMESTAMP_COLUMN,
+) -> list[FailureTrend]:
+    """Return checks whose failures are rising or newly appearing.
+
+    Failures are bucketed by ``granularity`` inside Postgres and the rolling
+    rates and week-over-week deltas are computed with window functions over a
+    dense check x bucket grid, so only one row per flagged check leaves the
+    database. ``lookback_days`` bounds the scan of ``validation_results`` on
+    ``timestamp_column``; that stays cheap on years of history only if the
+    column is indexed (e.g. ``CREATE INDEX ON validation_results (created_at)``).
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1 bucket (got {window}).")
+    bucket_days, week_lag = TREND_GRANULARITIES[granularity]
+    # Frame offsets cannot be bound parameters, so they are composed as literals.
+    query = sql.SQL("""
+        WITH params AS (
+            SELECT
+                date_trunc(%(granularity)s, now()) AS current_bucket,
+                date_trunc(%(granularity)s, now() - make_interval(days => %(lookback_days)s)) AS start_bucket
+        ),
+        buckets AS (
+            SELECT generate_series(p.start_bucket, p.current_bucket, %(step)s::interval) AS bucket
+            FROM params p
+        ),
+        scoped AS (
+            SELECT vr.checks, date_trunc(%(granularity)s, vr.{timestamp_column}) AS bucket
+            FROM validation_results vr, params p
+            WHERE vr.{timestamp_column} >= p.start_bucket
+        ),
+        runs AS (
+            SELECT bucket, COUNT(*) AS runs
+            FROM scoped
+            GROUP BY bucket
+        ),
+        failures AS (
+            SELECT s.bucket, checks_elem ->> 'name' AS check_name, COUNT(*) AS failures
+            FROM scoped s,
+                 LATERAL jsonb_array_elements(s.checks) AS checks_elem
+            WHERE COALESCE((checks_elem ->> 'passed')::boolean, false) IS FALSE
+            GROUP BY s.bucket, check_name
+        ),
+        series AS (
+            SELECT
+                c.check_name,
+                b.bucket,
+                COALESCE(f.failures, 0) AS failures,
+                COALESCE(r.runs, 0) AS runs
+            FROM (SELECT DISTINCT check_name FROM failures) c
+            CROSS JOIN buckets b
+            LEFT JOIN failures f ON f.check_name = c.check_name AND f.bucket = b.bucket
+            LEFT JOIN runs r ON r.bucket = b.bucket
+        ),
+        rolling AS (
+            SELECT
+                check_name,
+                bucket,
+                SUM(failures) OVER w AS window_failures,
+                SUM(runs) OVER w AS window_runs,
+                SUM(failures) OVER (PARTITION BY check_name ORDER BY bucket) AS cumulative_failures,
+                (SUM(failures) OVER w)::numeric / NULLIF(SUM(runs) OVER w, 0) AS rolling_rate
+            FROM series
+            WINDOW w AS (
+                PARTITION BY check_name ORDER BY bucket
+                ROWS BETWEEN {window_preceding} PRECEDING AND CURRENT ROW
+            )
+        ),
+        deltas AS (
+            SELECT
+                *,
+                LAG(rolling_rate, {week_lag}) OVER (PARTITION BY check_name ORDER BY bucket) AS previous_rate
+            FROM rolling
+        ),
+        latest AS (
+            SELECT
+                d.*,
+                d.rolling_rate - d.previous_rate AS rate_delta,
+                CASE
+                    WHEN d.cumulative_failures = d.window_failures THEN 'new'
+                    WHEN d.rolling_rate - d.previous_rate >= %(min_rate_delta)s THEN 'rising'
+                END AS status
+            FROM deltas d, params p
+            WHERE d.bucket = p.current_bucket
+        )
+        SELECT
+            check_name,
+            status,
+            bucket AS bucket_start,
+            window_failures,
+            window_runs,
+            rolling_rate,
+            previous_rate,
+            rate_delta
+        FROM latest
+        WHERE status IS NOT NULL
+          AND window_failures >= %(min_occurrences)s
+        ORDER BY status ASC, rate_delta DESC NULLS LAST, check_name ASC;
+    """).format(
+        timestamp_column=sql.Identifier(timestamp_column),
+        window_preceding=sql.Literal(window - 1),
+        week_lag=sql.Literal(week_lag),
+    )
+    params = {
+        "granularity": granularity,
+        "lookback_days": lookback_days,
+        "step": f"{bucket_days} days",
+        "min_rate_delta": min_rate_delta,
+        "min_occurrences": min_occurrences,
+    }
+    with psycopg2.connect(database_url) as conn:
+        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall()
+    trends = [
+        FailureTrend(
+            check_name=row["check_name"],
+            status=row["status"],
+            bucket_start=row["bucket_start"],
+            window_failures=int(row["window_failures"]),
+            window_runs=int(row["window_runs"]),
+            rolling_rate=float(row["rolling_rate"] or 0),
+            previous_rate=None if row["previous_rate"] is None else float(row["previous_rate"]),
+            rate_delta=None if row["rate_delta"] is None else float(row["rate_delta"]),
+        )
+        for row in rows
     ]
+    LOGGER.info("Identified %d rising or new issues by %s.", len(trends), granularity)
+    return trends
+
+
+def build_common_issues_table(
+    issues: Iterable[FrequentIssue],
+    trends: Optional[Mapping[str, FailureTrend]] = None,
+) -> str:
+    """Render a markdown table for common issues.
+
+    When ``trends`` is supplied a Trend column marks rising or new checks.
+    """
+    if trends is None:
+        lines = [
+            "| Check | Occurrences | Sample Details |",
+            "| --- | ---: | --- |",
+        ]
+    else:
+        lines = [
+            "| Check | Occurrences | Trend | Sample Details |",
+            "| --- | ---: | --- | --- |",
+        ]
     for issue in issues:
         details = issue.sample_details.replace("\n", " ").strip()
         if not details:
             details = "—"
-        lines.append(f"| {issue.check_name} | {issue.occurrences} | {details} |")
+        if trends is None:
+            lines.append(f"| {issue.check_name} | {issue.occurrences} | {details} |")
+            continue
+        trend = trends.get(issue.check_name)
+        trend_label = trend.describe() if trend else "—"
+        lines.append(f"| {issue.check_name} | {issue.occurrences} | {trend_label} | {details} |")
     return "\n".join(lines)
 
 
-def build_standard_suggestions(issues: Iterable[FrequentIssue]) -> str:
+def build_standard_suggestions(
+    issues: Iterable[FrequentIssue],
+    trends: Optional[Mapping[str, FailureTrend]] = None,
+) -> str:
+    trends = trends or {}
     lines = []
+    for trend in trends.values():
+        if trend.status == "new":
+            lines.append(
+                f"- Prioritize newly appearing `{trend.check_name}` failures "
+                f"({trend.window_failures} in {trend.window_runs} recent runs) before they become recurring."
+            )
+        else:
+            lines.append(
+                f"- Prioritize rising `{trend.check_name}` failures "
+                f"(rate up {trend.rate_delta * 100:.1f} pts week over week to {trend.rolling_rate:.1%})."
+            )
     for issue in issues:
+        if issue.check_name in trends:
+            continue
         suggestion = (
             f"- Investigate recurring `{issue.check_name}` failures "
             f"(observed {issue.occurrences} times) and codify remediation steps."
@@ -151,9 +390,33 @@ def main() -> None:
     if not database_url:
         raise SystemExit("NEON_DATABASE_URL or DATABASE_URL is not configured.")
 
+    trends: Optional[dict[str, FailureTrend]] = None
+    if args.trend:
+        bucket_days, week_lag = TREND_GRANULARITIES[args.trend]
+        window = args.trend_window if args.trend_window is not None else DEFAULT_TREND_WINDOWS[args.trend]
+        # Need history before the window to tell new checks apart and a week of lag for deltas.
+        required_days = bucket_days * (window + week_lag)
+        if args.trend_lookback_days < required_days:
+            raise SystemExit(
+                f"--trend-lookback-days must be at least {required_days} for a "
+                f"{window}-{args.trend} window."
+            )
+        trends = {
+            trend.check_name: trend
+            for trend in fetch_failure_trends(
+                database_url,
+                granularity=args.trend,
+                window=window,
+                lookback_days=args.trend_lookback_days,
+                min_occurrences=args.min_occurrences,
+                min_rate_delta=args.min_rate_delta,
+                timestamp_column=args.timestamp_column,
+            )
+        }
+
     issues = fetch_common_issues(database_url, args.min_occurrences)
-    common_table = build_common_issues_table(issues)
-    standards_list = build_standard_suggestions(issues)
+    common_table = build_common_issues_table(issues, trends)
+    standards_list = build_standard_suggestions(issues, trends)
 
     if args.dry_run:
         print("Common Issues Table:\n")
@@ -8,7 +8,7 @@ import logging
 import time
 from typing import Any, Dict
 
-from servicenow_tools.servicenow_api import ServiceNowClient, ServiceNowError
+from servicenow_tools.servicenow_api import ServiceNowClient, ServiceNowError, get_client, get_registry
 
 LOGGER = logging.getLogger(__name__)
 CATALOG_FIELDS = "sys_id,name,active,short_description,workflow,category,sc_catalogs"
@@ -130,7 +130,7 @@ def main() -> None:
     args = parse_args()
     configure_logging(args.verbose)
 
-    client = ServiceNowClient.from_environment(args.environment)
+    client = get_client(args.environment)
     targets = args.catalog_items[: args.catalog_limit] if args.catalog_limit else args.catalog_items
 
     results = [validate_catalog_item(client, sys_id) for sys_id in targets]
@@ -144,6 +144,8 @@ def main() -> None:
             json.dump(results, handle, indent=2)
         print(f"Validation payload written to {args.output_json}")
 
+    get_registry().log_stats()
+
 
 if __name__ == "__main__":
     main()